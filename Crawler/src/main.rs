@@ -14,7 +14,7 @@ use crawler::{
     models::{Campus, Config, LocaleConfig, Seed},
     pipeline::{crawl::run_crawler, map::run_mapper},
     storage::{NoticeStorage, local::LocalStorage},
-    utils::{fs, http, log},
+    utils::{cache::ResponseCache, fs, http, log},
 };
 
 #[cfg(feature = "s3")]
@@ -67,6 +67,10 @@ enum Command {
         /// Regenerate if the existing site map is older than N days
         #[arg(long)]
         refresh_days: Option<u64>,
+
+        /// Discard the cached HTTP responses and fetch every page from scratch
+        #[arg(long)]
+        no_cache: bool,
     },
     /// Fetch notices from discovered boards
     Crawl {
@@ -175,6 +179,7 @@ async fn main() -> Result<()> {
         Command::Map {
             force,
             refresh_days,
+            no_cache,
         } => {
             let base = std::env::current_dir()?;
             let site_map_path = config.departments_boards_path(&base);
@@ -206,9 +211,19 @@ async fn main() -> Result<()> {
                 return Ok(());
             }
 
+            // Revalidate pages from previous runs with conditional requests
+            let cache_path = config.http_cache_path(&base);
+            let cache = if no_cache {
+                ResponseCache::default()
+            } else {
+                ResponseCache::load(&cache_path)
+            };
+            http::enable_response_cache(cache);
+
             let client = http::create_async_client(&config.crawler)?;
             let campuses = run_mapper(config.as_ref(), &locale, &seed, &client).await?;
             fs::save_json(&site_map_path, &campuses)?;
+            http::save_response_cache(&cache_path)?;
 
             log::success(
                 &locale
@@ -176,4 +176,26 @@ mod tests {
         let campus = create_test_campus();
         assert_eq!(campus.department_count(), 1);
     }
+
+    #[test]
+    fn test_counts_include_campus_level_departments() {
+        let board = |id: &str| Board {
+            id: id.to_string(),
+            name: id.to_string(),
+            url: format!("https://example.com/{id}"),
+            selectors: CmsSelectors::default(),
+        };
+
+        let mut campus = create_test_campus();
+        campus.colleges[0].departments[0].boards = vec![board("notice"), board("scholarship")];
+        campus.departments.push(Department {
+            id: "dept2".to_string(),
+            name: "Department 2".to_string(),
+            url: "https://example.org".to_string(),
+            boards: vec![board("academic")],
+        });
+
+        assert_eq!(campus.department_count(), 2);
+        assert_eq!(campus.board_count(), 3);
+    }
 }
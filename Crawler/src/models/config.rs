@@ -121,6 +121,11 @@ impl Config {
     pub fn manual_review_path(&self, base: &Path) -> PathBuf {
         self.output_dir(base).join(&self.paths.manual_review_file)
     }
+
+    /// Get the full path to the HTTP response cache file.
+    pub fn http_cache_path(&self, base: &Path) -> PathBuf {
+        self.output_dir(base).join(&self.paths.http_cache_file)
+    }
 }
 
 impl Default for Config {
@@ -198,6 +203,10 @@ pub struct PathsConfig {
     /// Manual review items filename
     #[serde(default = "defaults::manual_review_file")]
     pub manual_review_file: String,
+
+    /// HTTP response cache filename (used by the mapper)
+    #[serde(default = "defaults::http_cache_file")]
+    pub http_cache_file: String,
 }
 
 impl Default for PathsConfig {
@@ -209,6 +218,7 @@ impl Default for PathsConfig {
             departments_file: defaults::departments_file(),
             departments_boards_file: defaults::departments_boards_file(),
             manual_review_file: defaults::manual_review_file(),
+            http_cache_file: defaults::http_cache_file(),
         }
     }
 }
@@ -631,6 +641,9 @@ mod defaults {
     pub fn manual_review_file() -> String {
         "Temp/manual_review_needed.json".into()
     }
+    pub fn http_cache_file() -> String {
+        "Temp/http_cache.json".into()
+    }
     pub fn departments_file() -> String {
         "Temp/yonsei_departments.json".into()
     }
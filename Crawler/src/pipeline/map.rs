@@ -11,7 +11,7 @@ use crate::services::{BoardDiscoveryService, DepartmentCrawler, SelectorDetector
 use crate::utils::log;
 
 /// Maximum concurrency for board discovery.
-const CONCURRENCY_LIMIT: usize = 14;
+const CONCURRENCY_LIMIT: usize = 32;
 
 /// Run the mapper to discover departments and boards.
 pub async fn run_mapper(
@@ -60,9 +60,10 @@ pub async fn run_mapper(
         &config.discovery,
     ));
 
-    let mut all_manual_reviews: Vec<ManualReviewItem> = Vec::new();
-
-    for campus in &mut campuses {
+    // Flatten every department into a single job list so discovery shares one
+    // concurrency window across all campuses and colleges.
+    let mut jobs = Vec::new();
+    for (campus_idx, campus) in campuses.iter_mut().enumerate() {
         log::info(
             &locale
                 .messages
@@ -70,56 +71,61 @@ pub async fn run_mapper(
                 .replace("{name}", &campus.campus),
         );
 
-        for college in &mut campus.colleges {
+        for (college_idx, college) in campus.colleges.iter_mut().enumerate() {
             // Temporarily take ownership of the Departments within the College.
             let departments = std::mem::take(&mut college.departments);
-
-            // Perform parallel processing using Stream
-            let (processed_depts, reviews): (Vec<_>, Vec<_>) = stream::iter(departments)
-                .map(|mut dept| {
-                    // Clone data for each task (Arc clone is cheap)
-                    let service = Arc::clone(&board_service);
-                    let campus_name = campus.campus.clone();
-                    let show_progress = config.logging.show_progress;
-
-                    // Clone logging messages (for move into async block)
-                    let msg_scanning = locale.messages.mapper_dept_scanning.clone();
-                    let msg_found = locale.messages.mapper_dept_found_boards.clone();
-
-                    async move {
-                        if show_progress {
-                            log::debug(&msg_scanning.replace("{name}", &dept.name));
-                        }
-
-                        // Actual discovery (asynchronous)
-                        let result = service.discover(&campus_name, &dept.name, &dept.url).await;
-
-                        dept.boards = result.boards;
-
-                        if show_progress {
-                            log::info(
-                                &msg_found.replace("{count}", &dept.boards.len().to_string()),
-                            );
-                        }
-
-                        // Return a tuple of (processed department, review items)
-                        (dept, result.manual_review)
-                    }
-                })
-                .buffer_unordered(CONCURRENCY_LIMIT) // Run N tasks concurrently
-                .collect::<Vec<_>>()
-                .await
-                .into_iter()
-                .unzip(); // Seperate processed departments and reviews
-
-            // Reassign the processed departments list
-            college.departments = processed_depts;
-
-            // Collect review items into a single vector
-            all_manual_reviews.extend(reviews.into_iter().flatten());
+            for dept in departments {
+                let job_idx = jobs.len();
+                jobs.push((job_idx, campus_idx, college_idx, dept));
+            }
         }
     }
 
+    // Tasks borrow shared data instead of cloning it per department;
+    // the stream is drained before `campuses` is mutated again.
+    let show_progress = config.logging.show_progress;
+    let msg_scanning = locale.messages.mapper_dept_scanning.as_str();
+    let msg_found = locale.messages.mapper_dept_found_boards.as_str();
+    let campus_names: Vec<&str> = campuses.iter().map(|c| c.campus.as_str()).collect();
+
+    // Perform parallel processing using Stream
+    let mut processed: Vec<_> = stream::iter(jobs)
+        .map(|(job_idx, campus_idx, college_idx, mut dept)| {
+            let service = Arc::clone(&board_service);
+            let campus_name = campus_names[campus_idx];
+
+            async move {
+                if show_progress {
+                    log::debug(&msg_scanning.replace("{name}", &dept.name));
+                }
+
+                // Actual discovery (asynchronous)
+                let result = service.discover(campus_name, &dept.name, &dept.url).await;
+
+                dept.boards = result.boards;
+
+                if show_progress {
+                    log::info(&msg_found.replace("{count}", &dept.boards.len().to_string()));
+                }
+
+                (job_idx, campus_idx, college_idx, dept, result.manual_review)
+            }
+        })
+        .buffer_unordered(CONCURRENCY_LIMIT) // Run N tasks concurrently
+        .collect()
+        .await;
+
+    // Reassign the processed departments to their colleges in the original order
+    processed.sort_unstable_by_key(|(job_idx, ..)| *job_idx);
+
+    let mut all_manual_reviews: Vec<ManualReviewItem> = Vec::new();
+    for (_, campus_idx, college_idx, dept, review) in processed {
+        campuses[campus_idx].colleges[college_idx]
+            .departments
+            .push(dept);
+        all_manual_reviews.extend(review);
+    }
+
     // Log summary of manual reviews
     if !all_manual_reviews.is_empty() {
         log::warn(&format!(
@@ -6,9 +6,10 @@
 //! and matching against known keywords.
 
 use std::collections::{HashMap, HashSet};
+use std::sync::LazyLock;
 
 use futures::future;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use reqwest::Client;
 use scraper::{Html, Selector};
 
@@ -16,8 +17,15 @@ use crate::error::Result;
 use crate::models::{
     Board, BoardDiscoveryResult, CmsSelectors, DiscoveryConfig, KeywordMapping, ManualReviewItem,
 };
-use crate::services::SelectorDetector;
-use crate::utils::{http::fetch_page_async, log, url};
+use crate::services::{HtmlSignature, SelectorDetector};
+use crate::utils::http::{fetch_page_async, fetch_text_async};
+use crate::utils::{log, url};
+
+/// Parsed once; used on every department page.
+static LINK_SELECTOR: LazyLock<Selector> = LazyLock::new(|| Selector::parse("a[href]").unwrap());
+
+/// Matches the text of a sitemap link.
+static SITEMAP_RE: LazyLock<Regex> = LazyLock::new(|| Regex::new(r"(?i)사이트맵|sitemap").unwrap());
 
 /// Service for discovering boards on department websites.
 pub struct BoardDiscoveryService<'a> {
@@ -25,6 +33,10 @@ pub struct BoardDiscoveryService<'a> {
     keywords: Vec<KeywordMapping>,
     selector_detector: SelectorDetector,
     config: DiscoveryConfig,
+    /// Blacklisted URL substrings, matched in a single pass
+    blacklist: RegexSet,
+    /// Board keywords in `keywords` order, matched in a single pass
+    keyword_set: RegexSet,
 }
 
 impl<'a> BoardDiscoveryService<'a> {
@@ -35,11 +47,17 @@ impl<'a> BoardDiscoveryService<'a> {
         selector_detector: SelectorDetector,
         config: &DiscoveryConfig,
     ) -> Self {
+        let blacklist = RegexSet::new(config.blacklist_patterns.iter().map(|p| regex::escape(p)))
+            .unwrap_or_else(|_| RegexSet::empty());
+        let keyword_set = RegexSet::new(keywords.iter().map(|m| regex::escape(&m.keyword)))
+            .unwrap_or_else(|_| RegexSet::empty());
         Self {
             client,
             keywords,
             selector_detector,
             config: config.clone(),
+            blacklist,
+            keyword_set,
         }
     }
 
@@ -62,8 +80,8 @@ impl<'a> BoardDiscoveryService<'a> {
             return result;
         }
 
-        let document = match self.fetch_department_page(dept_url).await {
-            Ok(doc) => doc,
+        let (document, signature) = match self.fetch_department_page(dept_url).await {
+            Ok(page) => page,
             Err(e) => {
                 result.manual_review = Some(ManualReviewItem {
                     campus: campus.to_string(),
@@ -77,7 +95,9 @@ impl<'a> BoardDiscoveryService<'a> {
 
         log::info(&format!("    Accessed: {dept_url}"));
 
-        let default_selectors = self.selector_detector.detect(&document, dept_url);
+        let default_selectors = self
+            .selector_detector
+            .detect_with_signature(&signature, dept_url);
 
         let sitemap_doc = self.find_sitemap(&document, dept_url).await;
         let source_doc = sitemap_doc.as_ref().unwrap_or(&document);
@@ -100,38 +120,41 @@ impl<'a> BoardDiscoveryService<'a> {
         url != "NOT_FOUND" && url.starts_with("http")
     }
 
-    async fn fetch_department_page(&self, url: &str) -> Result<Html> {
-        fetch_page_async(self.client, url).await
+    /// Fetch the homepage, scanning its raw source for CMS markers before parsing.
+    async fn fetch_department_page(&self, url: &str) -> Result<(Html, HtmlSignature)> {
+        let source = fetch_text_async(self.client, url).await?;
+        let signature = self.selector_detector.html_signature(&source);
+        Ok((Html::parse_document(&source), signature))
     }
 
     async fn find_sitemap(&self, document: &Html, base_url: &str) -> Option<Html> {
-        let link_selector = Selector::parse("a").ok()?;
-        let sitemap_pattern = Regex::new(r"(?i)사이트맵|sitemap").ok()?;
+        // Sitemap links often repeat in the header and footer; fetch each URL once
+        let mut tried = HashSet::new();
 
-        for element in document.select(&link_selector) {
+        for element in document.select(&LINK_SELECTOR) {
+            let Some(href) = element.value().attr("href") else {
+                continue;
+            };
             let text: String = element.text().collect();
-            if !sitemap_pattern.is_match(&text) {
+            if !SITEMAP_RE.is_match(&text) {
                 continue;
             }
 
-            if let Some(href) = element.value().attr("href") {
-                let sitemap_url = url::resolve(base_url, href);
-                if let Ok(sitemap_doc) = fetch_page_async(self.client, &sitemap_url).await {
-                    log::info(&format!("    Found sitemap: {sitemap_url}"));
-                    return Some(sitemap_doc);
-                }
+            // A link back to the homepage would only re-fetch the page already parsed
+            let sitemap_url = url::resolve(base_url, href);
+            if url::is_same_page(&sitemap_url, base_url) || !tried.insert(sitemap_url.clone()) {
+                continue;
+            }
+            if let Ok(sitemap_doc) = fetch_page_async(self.client, &sitemap_url).await {
+                log::info(&format!("    Found sitemap: {sitemap_url}"));
+                return Some(sitemap_doc);
             }
         }
         None
     }
 
     fn is_valid_board_link(&self, text: &str, href: &str) -> bool {
-        if self
-            .config
-            .blacklist_patterns
-            .iter()
-            .any(|p| href.contains(p))
-        {
+        if self.blacklist.is_match(href) {
             return false;
         }
         text.chars().count() <= self.config.max_board_name_length
@@ -145,25 +168,27 @@ impl<'a> BoardDiscoveryService<'a> {
     ) -> Vec<Board> {
         let mut id_counts: HashMap<String, usize> = HashMap::new();
         let base_domain = url::get_domain(base_url);
-        let link_selector = Selector::parse("a[href]").unwrap();
 
         let mut seen_urls = HashSet::new();
         let mut links_to_process = Vec::new();
 
-        for element in document.select(&link_selector) {
-            let text = element.text().collect::<String>().trim().to_string();
+        for element in document.select(&LINK_SELECTOR) {
             if let Some(href) = element.value().attr("href") {
+                // Reject on the raw href before collecting text or resolving it
+                if href.contains("javascript") || href == "#" {
+                    continue;
+                }
+                let text = element.text().collect::<String>().trim().to_string();
                 if !self.is_valid_board_link(&text, href) {
                     continue;
                 }
                 let full_url = url::resolve(base_url, href);
-                if seen_urls.contains(&full_url) || href.contains("javascript") || href == "#" {
+                if seen_urls.contains(&full_url) {
                     continue;
                 }
 
-                if let (Some(base_dom), Some(link_dom)) = (&base_domain, url::get_domain(&full_url))
-                {
-                    if base_dom != &link_dom {
+                if let Some(base_dom) = &base_domain {
+                    if !url::has_domain(&full_url, base_dom) {
                         continue;
                     }
                 }
@@ -200,7 +225,9 @@ impl<'a> BoardDiscoveryService<'a> {
         url: String,
         default_selectors: &Option<CmsSelectors>,
     ) -> Option<Board> {
-        let mapping = self.keywords.iter().find(|m| text.contains(&m.keyword))?;
+        // The lowest matching index is the first keyword contained in the text
+        let idx = self.keyword_set.matches(&text).iter().next()?;
+        let mapping = &self.keywords[idx];
         let selectors = self.detect_board_selectors(&url, default_selectors).await?;
         let board_name = if text.is_empty() {
             mapping.display_name.clone()
@@ -224,8 +251,14 @@ impl<'a> BoardDiscoveryService<'a> {
             return Some(selectors.clone());
         }
 
-        if let Ok(board_doc) = fetch_page_async(self.client, url).await {
-            if let Some(selectors) = self.selector_detector.detect(&board_doc, url) {
+        // The URL alone may settle the CMS type without fetching the board page
+        if let Some(selectors) = self.selector_detector.detect_from_url(url) {
+            return Some(selectors);
+        }
+
+        // Only the raw source is needed for detection, so skip parsing the board page
+        if let Ok(source) = fetch_text_async(self.client, url).await {
+            if let Some(selectors) = self.selector_detector.detect(&source, url) {
                 return Some(selectors);
             }
         }
@@ -4,6 +4,9 @@
 //!
 //! Crawls campus pages to discover departments and their homepage URLs.
 
+use std::collections::{HashMap, HashSet};
+use std::sync::LazyLock;
+
 use futures::stream::{self, StreamExt, TryStreamExt};
 use regex::Regex;
 use reqwest::Client;
@@ -13,6 +16,15 @@ use crate::error::Result;
 use crate::models::{Campus, CampusInfo, College, Department};
 use crate::utils::{http::fetch_page_async, log};
 
+/// Parsed once; used on every campus page.
+static MAIN_SELECTOR: LazyLock<Selector> = LazyLock::new(|| Selector::parse("main").unwrap());
+static H1_SELECTOR: LazyLock<Selector> = LazyLock::new(|| Selector::parse("h1").unwrap());
+static LINK_SELECTOR: LazyLock<Selector> = LazyLock::new(|| Selector::parse("a[href]").unwrap());
+
+/// Captures the subdomain of a Yonsei homepage URL.
+static SUBDOMAIN_RE: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"https?://([^.]+)\.yonsei\.ac\.kr").unwrap());
+
 /// Service for crawling campus department information.
 pub struct DepartmentCrawler<'a> {
     client: &'a Client,
@@ -53,7 +65,7 @@ impl<'a> DepartmentCrawler<'a> {
         };
 
         // Extract departments and group by college
-        let dept_info = self.extract_departments_from_main(main_elem, &document);
+        let dept_info = self.extract_departments_from_main(main_elem);
         self.group_into_colleges(&mut campus, dept_info);
 
         let count = campus.department_count();
@@ -63,31 +75,27 @@ impl<'a> DepartmentCrawler<'a> {
     }
 
     fn find_main_content<'b>(&self, document: &'b Html) -> Option<ElementRef<'b>> {
-        let main_selector = Selector::parse("main").ok()?;
-        document.select(&main_selector).next()
+        document.select(&MAIN_SELECTOR).next()
     }
 
     fn group_into_colleges(&self, campus: &mut Campus, dept_info: Vec<(String, String, String)>) {
+        let mut college_index: HashMap<String, usize> = HashMap::new();
+        let mut seen: HashSet<(usize, String)> = HashSet::new();
+
         for (college_name, dept_name, dept_url) in dept_info {
             // Find or create college
-            let college_idx = campus
-                .colleges
-                .iter()
-                .position(|c| c.name == college_name)
-                .unwrap_or_else(|| {
+            let college_idx = *college_index
+                .entry(college_name)
+                .or_insert_with_key(|name| {
                     campus.colleges.push(College {
-                        name: college_name.clone(),
+                        name: name.clone(),
                         departments: Vec::new(),
                     });
                     campus.colleges.len() - 1
                 });
 
             // Skip duplicates
-            if campus.colleges[college_idx]
-                .departments
-                .iter()
-                .any(|d| d.name == dept_name)
-            {
+            if !seen.insert((college_idx, dept_name.clone())) {
                 continue;
             }
 
@@ -109,35 +117,24 @@ impl<'a> DepartmentCrawler<'a> {
     fn extract_departments_from_main(
         &self,
         main_elem: ElementRef,
-        document: &Html,
     ) -> Vec<(String, String, String)> {
-        let Ok(h1_selector) = Selector::parse("h1") else {
-            return Vec::new();
-        };
-
-        let college_pattern = Regex::new(r"([가-힣]+대학)$").unwrap();
         let mut results: Vec<(String, String, String)> = Vec::new();
         let mut current_college = String::new();
 
-        let homepage_urls = self.extract_all_homepage_urls(document);
+        let homepage_urls = self.extract_all_homepage_urls(main_elem);
         let mut url_iter = homepage_urls.into_iter().peekable();
 
-        let html = main_elem.html();
-        let fragment = Html::parse_fragment(&html);
-
-        for header in fragment.select(&h1_selector) {
+        // Select headers in place rather than re-parsing a serialized copy of <main>
+        for header in main_elem.select(&H1_SELECTOR) {
             let text = self.clean_header_text(header);
             if text.is_empty() {
                 continue;
             }
 
-            if college_pattern.is_match(&text) {
+            if is_college_name(&text) {
                 current_college = text;
             } else if !current_college.is_empty() && !text.contains("대학") {
-                let dept_url = url_iter
-                    .next()
-                    .map(|(_, url)| url)
-                    .unwrap_or_else(|| "NOT_FOUND".to_string());
+                let dept_url = url_iter.next().unwrap_or_else(|| "NOT_FOUND".to_string());
                 results.push((current_college.clone(), text, dept_url));
             }
         }
@@ -145,52 +142,82 @@ impl<'a> DepartmentCrawler<'a> {
     }
 
     fn clean_header_text(&self, header: ElementRef) -> String {
-        let mut text: String = header.text().collect();
-        for suffix in &["교수진", "홈페이지"] {
-            if let Some(idx) = text.find(suffix) {
-                text = text[..idx].to_string();
-            }
-        }
-        text.trim().to_string()
+        let text: String = header.text().collect();
+        strip_header_suffix(&text).to_string()
     }
 
-    /// Find all homepage URLs in the document.
-    fn extract_all_homepage_urls(&self, document: &Html) -> Vec<(usize, String)> {
-        let Ok(link_selector) = Selector::parse("a") else {
-            return Vec::new();
-        };
-
-        let html = document.html();
-        let mut urls: Vec<(usize, String)> = document
-            .select(&link_selector)
+    /// Find all homepage URLs within the main content, in document order.
+    fn extract_all_homepage_urls(&self, main_elem: ElementRef) -> Vec<String> {
+        main_elem
+            .select(&LINK_SELECTOR)
             .filter_map(|element| {
-                let text: String = element.text().collect();
-                if !text.contains("홈페이지") {
-                    return None;
-                }
+                // Check the href first; it is cheaper than collecting the link text
                 let href = element.value().attr("href")?;
                 if !href.starts_with("http") || href.starts_with('#') {
                     return None;
                 }
-                let pos = html.find(href)?;
-                Some((pos, href.to_string()))
+                let text: String = element.text().collect();
+                if !text.contains("홈페이지") {
+                    return None;
+                }
+                Some(href.to_string())
             })
-            .collect();
-        urls.sort_by_key(|(pos, _)| *pos);
-        urls
+            .collect()
     }
 
     /// Generate a unique department ID from name or URL.
     fn generate_department_id(name: &str, url: &str) -> String {
         if url != "NOT_FOUND" {
-            if let Ok(re) = Regex::new(r"https?://([^.]+)\.yonsei\.ac\.kr") {
-                if let Some(caps) = re.captures(url) {
-                    if let Some(subdomain) = caps.get(1) {
-                        return format!("yonsei_{}", subdomain.as_str().to_lowercase());
-                    }
-                }
+            if let Some(subdomain) = SUBDOMAIN_RE.captures(url).and_then(|caps| caps.get(1)) {
+                return format!("yonsei_{}", subdomain.as_str().to_lowercase());
             }
         }
         format!("yonsei_{}", name.to_lowercase().replace(' ', "_"))
     }
 }
+
+/// Cut a header at the first "교수진" or "홈페이지" label and trim it, in one pass.
+fn strip_header_suffix(text: &str) -> &str {
+    let cut = ["교수진", "홈페이지"]
+        .iter()
+        .filter_map(|label| text.find(label))
+        .min()
+        .unwrap_or(text.len());
+    text[..cut].trim()
+}
+
+/// Check if a header names a college (e.g., "공과대학").
+///
+/// Equivalent to matching `[가-힣]+대학$`: the text must end in "대학" preceded by a Hangul syllable.
+fn is_college_name(text: &str) -> bool {
+    text.strip_suffix("대학")
+        .and_then(|prefix| prefix.chars().next_back())
+        .is_some_and(|c| ('가'..='힣').contains(&c))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_strip_header_suffix() {
+        assert_eq!(
+            strip_header_suffix(" 기계공학부 교수진 홈페이지 "),
+            "기계공학부"
+        );
+        assert_eq!(
+            strip_header_suffix("전기전자공학부홈페이지교수진"),
+            "전기전자공학부"
+        );
+        assert_eq!(strip_header_suffix("  공과대학  "), "공과대학");
+    }
+
+    #[test]
+    fn test_is_college_name() {
+        assert!(is_college_name("공과대학"));
+        assert!(is_college_name("Yonsei 공과대학"));
+        assert!(!is_college_name("대학"));
+        assert!(!is_college_name("Graduate 대학"));
+        assert!(!is_college_name("대학원"));
+    }
+}
@@ -16,4 +16,4 @@ mod selectors;
 pub use boards::BoardDiscoveryService;
 pub use departments::DepartmentCrawler;
 pub use notices::NoticeCrawler;
-pub use selectors::SelectorDetector;
+pub use selectors::{HtmlSignature, SelectorDetector};
@@ -4,11 +4,11 @@
 //!
 //! Fetches notices from department boards using configured CSS selectors.
 
-use std::collections::{HashMap, HashSet};
+use std::collections::{HashMap, HashSet, VecDeque};
 use std::sync::Arc;
 use std::time::Duration;
 
-use futures::stream::{self, StreamExt};
+use futures::stream::{self, FuturesUnordered, StreamExt};
 use reqwest::Client;
 use scraper::Selector;
 
@@ -79,7 +79,6 @@ impl NoticeCrawler {
             ..CrawlOutcome::default()
         };
 
-        let mut notice_buffer = Vec::new();
         let mut board_stream = stream::iter(board_jobs)
             .map(|(dept_ref, board)| {
                 let selector_cache = Arc::clone(&selector_cache);
@@ -96,88 +95,99 @@ impl NoticeCrawler {
             })
             .buffer_unordered(concurrency);
 
-        while let Some((board, result)) = board_stream.next().await {
-            match result {
-                Ok(list_result) => {
-                    outcome.notice_total += list_result.row_total;
-                    outcome.notice_failures += list_result.row_failures;
-                    notice_buffer.extend(list_result.notices);
-                }
-                Err(error) => {
-                    outcome.board_failures += 1;
-                    outcome.errors.push(Self::build_error(
-                        CrawlStage::BoardList,
-                        Some(board),
-                        Some(&board.url),
-                        None,
-                        &error,
-                    ));
-                    log::warn(&format!(
-                        "Failed to fetch board list {} ({}): {}",
-                        board.name, board.url, error
-                    ));
-                }
+        // Stage 2: Fetch details for each notice concurrently. Detail fetches start as soon
+        // as their board list arrives instead of waiting for every board to finish.
+        let detail_job = |notice: Notice| {
+            let board_lookup = Arc::clone(&board_lookup);
+            let selector_cache = Arc::clone(&selector_cache);
+            let notice_id = notice.canonical_id();
+            let board_id = notice.board_id.clone();
+            let board_name = notice.board_name.clone();
+            let url = notice.link.clone();
+            async move {
+                let result = self
+                    .fetch_notice_detail(notice, &board_lookup, &selector_cache)
+                    .await;
+                (notice_id, board_id, board_name, url, result)
             }
-        }
+        };
 
         let mut seen = HashSet::new();
-        let mut deduped = Vec::new();
-        for notice in notice_buffer {
-            let id = notice.canonical_id();
-            if seen.insert(id) {
-                deduped.push(notice);
+        let mut pending = VecDeque::new();
+        let mut detail_stream = FuturesUnordered::new();
+        let mut detailed = Vec::new();
+        let mut detail_errors = Vec::new();
+        let mut boards_done = false;
+
+        loop {
+            while detail_stream.len() < concurrency {
+                let Some(notice) = pending.pop_front() else {
+                    break;
+                };
+                detail_stream.push(detail_job(notice));
             }
-        }
-
-        // Stage 2: Fetch details for each notice concurrently.
-        outcome.detail_total = deduped.len();
-        let detailed_notices = stream::iter(deduped)
-            .map(|notice| {
-                let board_lookup = Arc::clone(&board_lookup);
-                let selector_cache = Arc::clone(&selector_cache);
-                let notice_id = notice.canonical_id();
-                let board_id = notice.board_id.clone();
-                let board_name = notice.board_name.clone();
-                let url = notice.link.clone();
-                async move {
-                    let result = self
-                        .fetch_notice_detail(notice, &board_lookup, &selector_cache)
-                        .await;
-                    (notice_id, board_id, board_name, url, result)
-                }
-            })
-            .buffer_unordered(concurrency);
 
-        let mut detailed = Vec::new();
-        let mut detail_stream = detailed_notices;
-        while let Some((notice_id, board_id, board_name, url, result)) = detail_stream.next().await
-        {
-            match result {
-                Ok(notice) => detailed.push(notice),
-                Err(error) => {
-                    outcome.detail_failures += 1;
-                    let stage = if matches!(
-                        &error,
-                        AppError::Crawl { context, .. } if context == "find_board"
-                    ) {
-                        CrawlStage::BoardLookup
-                    } else {
-                        CrawlStage::NoticeDetail
-                    };
-                    outcome.errors.push(CrawlError {
-                        stage,
-                        board_id: Some(board_id),
-                        board_name: Some(board_name),
-                        url: Some(url),
-                        notice_id: Some(notice_id),
-                        message: error.to_string(),
-                        retryable: error.is_retryable(),
-                    });
-                    log::warn(&format!("Failed to fetch notice detail: {}", error));
+            // Drive both stages together so that in-flight board fetches keep progressing
+            tokio::select! {
+                next = board_stream.next(), if !boards_done => match next {
+                    Some((_, Ok(list_result))) => {
+                        outcome.notice_total += list_result.row_total;
+                        outcome.notice_failures += list_result.row_failures;
+                        for notice in list_result.notices {
+                            if seen.insert(notice.canonical_id()) {
+                                outcome.detail_total += 1;
+                                pending.push_back(notice);
+                            }
+                        }
+                    }
+                    Some((board, Err(error))) => {
+                        outcome.board_failures += 1;
+                        outcome.errors.push(Self::build_error(
+                            CrawlStage::BoardList,
+                            Some(board),
+                            Some(&board.url),
+                            None,
+                            &error,
+                        ));
+                        log::warn(&format!(
+                            "Failed to fetch board list {} ({}): {}",
+                            board.name, board.url, error
+                        ));
+                    }
+                    None => boards_done = true,
+                },
+                Some((notice_id, board_id, board_name, url, result)) = detail_stream.next() => {
+                    match result {
+                        Ok(notice) => detailed.push(notice),
+                        Err(error) => {
+                            outcome.detail_failures += 1;
+                            let stage = if matches!(
+                                &error,
+                                AppError::Crawl { context, .. } if context == "find_board"
+                            ) {
+                                CrawlStage::BoardLookup
+                            } else {
+                                CrawlStage::NoticeDetail
+                            };
+                            detail_errors.push(CrawlError {
+                                stage,
+                                board_id: Some(board_id),
+                                board_name: Some(board_name),
+                                url: Some(url),
+                                notice_id: Some(notice_id),
+                                message: error.to_string(),
+                                retryable: error.is_retryable(),
+                            });
+                            log::warn(&format!("Failed to fetch notice detail: {}", error));
+                        }
+                    }
                 }
+                else => break,
             }
         }
 
+        // Keep board errors ahead of detail errors, as in the report layout
+        outcome.errors.extend(detail_errors);
         outcome.notices = detailed;
         Ok(outcome)
     }
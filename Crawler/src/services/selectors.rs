@@ -4,64 +4,119 @@
 //!
 //! Detects the CMS type used by a website and returns appropriate CSS selectors.
 
-use scraper::Html;
+use regex::RegexSet;
 
 use crate::models::{CmsPattern, CmsSelectors, Seed};
 use crate::utils::log::debug;
 
+/// HTML-derived part of CMS detection: which patterns' markers appear in a page.
+///
+/// Computing this once per page lets callers combine it with many URLs
+/// without rescanning the page source.
+#[derive(Debug, Clone, Default)]
+pub struct HtmlSignature(Vec<bool>);
+
+impl HtmlSignature {
+    fn matches(&self, pattern_idx: usize) -> bool {
+        self.0.get(pattern_idx).copied().unwrap_or(false)
+    }
+}
+
 /// Service for detecting CMS types and returning appropriate selectors.
 pub struct SelectorDetector {
     patterns: Vec<CmsPattern>,
+    /// Case-insensitive `detect_html_contains` markers, scanned in a single pass
+    html_markers: RegexSet,
+    /// Pattern index for each entry in `html_markers`
+    marker_patterns: Vec<usize>,
 }
 
 impl SelectorDetector {
     /// Create a new selector detector with the given patterns.
     pub fn new(patterns: Vec<CmsPattern>) -> Self {
-        Self { patterns }
+        let (marker_patterns, markers): (Vec<_>, Vec<_>) = patterns
+            .iter()
+            .enumerate()
+            .filter_map(|(idx, p)| {
+                let marker = p.detect_html_contains.as_ref()?;
+                Some((idx, format!("(?i){}", regex::escape(marker))))
+            })
+            .unzip();
+        let html_markers = RegexSet::new(markers).unwrap_or_else(|_| RegexSet::empty());
+        Self {
+            patterns,
+            html_markers,
+            marker_patterns,
+        }
     }
 
-    /// Detect CMS type and return appropriate selectors.
+    /// Detect CMS type from the raw page source and return appropriate selectors.
     /// Returns the selectors and the matched pattern name.
-    pub fn detect(&self, document: &Html, url: &str) -> Option<CmsSelectors> {
-        let html_lower = document.html().to_lowercase();
-
-        self.patterns.iter().find_map(|pattern| {
-            if self.matches_pattern(pattern, url, &html_lower) {
-                // Log the detected CMS pattern name for debugging
-                if cfg!(debug_assertions) {
-                    debug(&format!(
-                        "Detected CMS pattern: '{}' for URL: {}",
-                        pattern.name, url
-                    ));
-                }
-                Some(CmsSelectors::from_pattern(
-                    &pattern.row_selector,
-                    &pattern.title_selector,
-                    &pattern.date_selector,
-                    &pattern.link_attr,
-                ))
-            } else {
-                None
-            }
-        })
+    pub fn detect(&self, source: &str, url: &str) -> Option<CmsSelectors> {
+        self.detect_with_signature(&self.html_signature(source), url)
     }
 
-    fn matches_pattern(&self, pattern: &CmsPattern, url: &str, html_lower: &str) -> bool {
-        // Check URL pattern
-        if let Some(url_pattern) = &pattern.detect_url_contains {
-            if url.contains(url_pattern) {
-                return true;
-            }
+    /// Compute which pattern markers appear in the raw page source.
+    pub fn html_signature(&self, source: &str) -> HtmlSignature {
+        let mut matched = vec![false; self.patterns.len()];
+        for marker_idx in self.html_markers.matches(source).iter() {
+            matched[self.marker_patterns[marker_idx]] = true;
         }
+        HtmlSignature(matched)
+    }
 
-        // Check HTML pattern
-        if let Some(html_pattern) = &pattern.detect_html_contains {
-            if html_lower.contains(&html_pattern.to_lowercase()) {
-                return true;
-            }
+    /// Detect CMS type from a precomputed HTML signature and the page URL.
+    pub fn detect_with_signature(
+        &self,
+        signature: &HtmlSignature,
+        url: &str,
+    ) -> Option<CmsSelectors> {
+        self.patterns
+            .iter()
+            .enumerate()
+            .find(|(idx, pattern)| signature.matches(*idx) || Self::matches_url(pattern, url))
+            .map(|(_, pattern)| Self::selectors_for(pattern, url))
+    }
+
+    /// Detect CMS type from the URL alone, without fetching the page.
+    ///
+    /// Returns `None` when the result could depend on page content, i.e. when a
+    /// higher-priority pattern has an HTML marker.
+    pub fn detect_from_url(&self, url: &str) -> Option<CmsSelectors> {
+        let idx = self
+            .patterns
+            .iter()
+            .position(|pattern| Self::matches_url(pattern, url))?;
+        if self.patterns[..idx]
+            .iter()
+            .any(|pattern| pattern.detect_html_contains.is_some())
+        {
+            return None;
+        }
+        Some(Self::selectors_for(&self.patterns[idx], url))
+    }
+
+    fn selectors_for(pattern: &CmsPattern, url: &str) -> CmsSelectors {
+        // Log the detected CMS pattern name for debugging
+        if cfg!(debug_assertions) {
+            debug(&format!(
+                "Detected CMS pattern: '{}' for URL: {}",
+                pattern.name, url
+            ));
         }
+        CmsSelectors::from_pattern(
+            &pattern.row_selector,
+            &pattern.title_selector,
+            &pattern.date_selector,
+            &pattern.link_attr,
+        )
+    }
 
-        false
+    fn matches_url(pattern: &CmsPattern, url: &str) -> bool {
+        pattern
+            .detect_url_contains
+            .as_ref()
+            .is_some_and(|url_pattern| url.contains(url_pattern))
     }
 }
 
@@ -80,4 +135,55 @@ mod tests {
         let detector = SelectorDetector::default();
         assert!(!detector.patterns.is_empty());
     }
+
+    #[test]
+    fn test_detect_html_marker_case_insensitive() {
+        let detector = SelectorDetector::default();
+        let source = r#"<ul class="XE-List-Board"></ul>"#;
+        let selectors = detector
+            .detect(source, "https://example.com/board")
+            .expect("xe board should be detected");
+        assert_eq!(selectors.title_selector, "a.xe-list-board-list__title-link");
+    }
+
+    #[test]
+    fn test_detect_with_signature_reuses_html_match() {
+        let detector = SelectorDetector::default();
+        let signature = detector.html_signature(r#"<a class="c-board-title">공지</a>"#);
+        assert!(
+            detector
+                .detect_with_signature(&signature, "https://example.com/a")
+                .is_some()
+        );
+        assert!(
+            detector
+                .detect_with_signature(&HtmlSignature::default(), "https://example.com/a")
+                .is_none()
+        );
+    }
+
+    #[test]
+    fn test_detect_from_url() {
+        let detector = SelectorDetector::default();
+        assert!(
+            detector
+                .detect_from_url("https://example.com/notice.do")
+                .is_some()
+        );
+        assert!(
+            detector
+                .detect_from_url("https://example.com/notice")
+                .is_none()
+        );
+
+        // A higher-priority HTML marker means the page must be inspected
+        let mut patterns = Seed::default().cms_patterns;
+        patterns.reverse();
+        let detector = SelectorDetector::new(patterns);
+        assert!(
+            detector
+                .detect_from_url("https://example.com/notice.do")
+                .is_none()
+        );
+    }
 }
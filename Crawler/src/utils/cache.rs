@@ -0,0 +1,126 @@
+// src/utils/cache.rs
+
+//! On-disk HTTP response cache for conditional requests.
+//!
+//! Stores response bodies with their `ETag`/`Last-Modified` validators so that
+//! repeat runs can revalidate with `If-None-Match`/`If-Modified-Since` and reuse
+//! the cached body on `304 Not Modified`.
+
+use std::collections::HashMap;
+use std::path::Path;
+use std::sync::Mutex;
+
+use serde::{Deserialize, Serialize};
+
+use crate::error::Result;
+use crate::utils::fs;
+
+/// A cached response body with its validators.
+#[derive(Debug, Clone, Serialize, Deserialize)]
+pub struct CachedResponse {
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub etag: Option<String>,
+
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub last_modified: Option<String>,
+
+    pub body: String,
+}
+
+/// URL-keyed response cache persisted as a JSON file.
+#[derive(Debug, Default)]
+pub struct ResponseCache {
+    entries: Mutex<HashMap<String, CachedResponse>>,
+}
+
+impl ResponseCache {
+    /// Load a cache from a JSON file, starting empty if it is missing or unreadable.
+    pub fn load(path: &Path) -> Self {
+        let entries = std::fs::read_to_string(path)
+            .ok()
+            .and_then(|content| serde_json::from_str(&content).ok())
+            .unwrap_or_default();
+        Self {
+            entries: Mutex::new(entries),
+        }
+    }
+
+    /// Save the cache to a JSON file.
+    pub fn save(&self, path: &Path) -> Result<()> {
+        let entries = self.lock();
+        let json = serde_json::to_vec(&*entries)?;
+        fs::write(path, json)
+    }
+
+    /// Get the `(ETag, Last-Modified)` validators stored for a URL.
+    pub fn validators(&self, url: &str) -> Option<(Option<String>, Option<String>)> {
+        let entries = self.lock();
+        let entry = entries.get(url)?;
+        Some((entry.etag.clone(), entry.last_modified.clone()))
+    }
+
+    /// Get the cached body for a URL.
+    pub fn body(&self, url: &str) -> Option<String> {
+        self.lock().get(url).map(|entry| entry.body.clone())
+    }
+
+    /// Store a response for a URL, replacing any previous entry.
+    pub fn insert(&self, url: &str, response: CachedResponse) {
+        self.lock().insert(url.to_string(), response);
+    }
+
+    /// Number of cached responses.
+    pub fn len(&self) -> usize {
+        self.lock().len()
+    }
+
+    /// Check if the cache is empty.
+    pub fn is_empty(&self) -> bool {
+        self.lock().is_empty()
+    }
+
+    fn lock(&self) -> std::sync::MutexGuard<'_, HashMap<String, CachedResponse>> {
+        self.entries.lock().unwrap_or_else(|e| e.into_inner())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use tempfile::tempdir;
+
+    #[test]
+    fn test_save_and_load_roundtrip() {
+        let dir = tempdir().unwrap();
+        let path = dir.path().join("http_cache.json");
+
+        let cache = ResponseCache::default();
+        cache.insert(
+            "https://example.com/",
+            CachedResponse {
+                etag: Some("\"abc\"".to_string()),
+                last_modified: None,
+                body: "<html></html>".to_string(),
+            },
+        );
+        cache.save(&path).unwrap();
+
+        let loaded = ResponseCache::load(&path);
+        assert_eq!(loaded.len(), 1);
+        assert_eq!(
+            loaded.validators("https://example.com/"),
+            Some((Some("\"abc\"".to_string()), None))
+        );
+        assert_eq!(
+            loaded.body("https://example.com/").as_deref(),
+            Some("<html></html>")
+        );
+    }
+
+    #[test]
+    fn test_load_missing_file_is_empty() {
+        let dir = tempdir().unwrap();
+        let cache = ResponseCache::load(&dir.path().join("missing.json"));
+        assert!(cache.is_empty());
+    }
+}
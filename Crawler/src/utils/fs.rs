@@ -3,15 +3,23 @@
 //! File system utilities.
 
 use std::fs;
-use std::io::Write;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 
 use crate::error::Result;
 
 /// Save data to a JSON file with pretty printing.
+///
+/// The JSON is streamed into a buffered file rather than built as one string first.
 pub fn save_json<T: serde::Serialize>(path: &Path, data: &T) -> Result<()> {
-    let json = serde_json::to_string_pretty(data)?;
-    write(path, json)?;
+    // Ensure parent directory exists
+    if let Some(parent) = path.parent() {
+        create_dir_all(parent)?;
+    }
+
+    let mut writer = BufWriter::new(fs::File::create(path)?);
+    serde_json::to_writer_pretty(&mut writer, data)?;
+    writer.flush()?;
     Ok(())
 }
 
@@ -67,4 +75,16 @@ mod tests {
             .unwrap();
         assert_eq!(content, "hello");
     }
+
+    #[test]
+    fn test_save_json_creates_parent_dir() {
+        let dir = tempdir().unwrap();
+        let file_path = dir.path().join("nested").join("data.json");
+
+        save_json(&file_path, &vec!["공지", "notice"]).unwrap();
+
+        let content = fs::read_to_string(&file_path).unwrap();
+        let data: Vec<String> = serde_json::from_str(&content).unwrap();
+        assert_eq!(data, vec!["공지", "notice"]);
+    }
 }
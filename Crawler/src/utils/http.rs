@@ -2,15 +2,74 @@
 
 //! HTTP client utilities.
 
+use std::collections::HashMap;
+use std::path::Path;
+use std::sync::{Arc, LazyLock, Mutex, OnceLock};
 use std::time::Duration;
 
 use reqwest::{StatusCode, header};
 use scraper::Html;
+use tokio::sync::Semaphore;
 
 use crate::error::{AppError, Result};
 use crate::models::CrawlerConfig;
+use crate::utils::cache::{CachedResponse, ResponseCache};
+use crate::utils::url::get_domain;
+
+/// Maximum idle keep-alive connections retained per host.
+const POOL_MAX_IDLE_PER_HOST: usize = 32;
+
+/// Number of retries for transient failures (timeouts, 429, 5xx).
+const MAX_RETRIES: u32 = 3;
+
+/// Base delay for exponential backoff between retries.
+const RETRY_BACKOFF_MS: u64 = 300;
+
+/// Maximum response body size in bytes.
+const MAX_BODY_BYTES: u64 = 2_000_000;
+
+/// Maximum in-flight requests to a single host.
+const MAX_CONCURRENT_PER_HOST: usize = 4;
+
+/// Per-host request slots, shared by all fetches in the process.
+static HOST_SLOTS: LazyLock<Mutex<HashMap<String, Arc<Semaphore>>>> =
+    LazyLock::new(Default::default);
+
+/// Response cache used for conditional requests, if enabled.
+static RESPONSE_CACHE: OnceLock<ResponseCache> = OnceLock::new();
+
+/// Enable the on-disk response cache for all subsequent fetches.
+///
+/// Has no effect if a cache is already enabled.
+pub fn enable_response_cache(cache: ResponseCache) {
+    let _ = RESPONSE_CACHE.set(cache);
+}
+
+/// Save the response cache, if enabled, to a JSON file.
+pub fn save_response_cache(path: &Path) -> Result<()> {
+    match RESPONSE_CACHE.get() {
+        Some(cache) => cache.save(path),
+        None => Ok(()),
+    }
+}
+
+/// Get the request slots for the host of `url`.
+fn host_slots(url: &str) -> Arc<Semaphore> {
+    let host = get_domain(url).unwrap_or_default();
+    let mut slots = HOST_SLOTS.lock().unwrap_or_else(|e| e.into_inner());
+    let semaphore = slots
+        .entry(host)
+        .or_insert_with(|| Arc::new(Semaphore::new(MAX_CONCURRENT_PER_HOST)));
+    Arc::clone(semaphore)
+}
 
 /// Create a configured asynchronous HTTP client.
+///
+/// The client keeps a pool of keep-alive connections per host, so it should be
+/// created once and shared (it is cheap to clone) rather than built per request.
+///
+/// HTTP/2 is negotiated via ALPN where the server supports it, multiplexing requests to
+/// a host over one connection. Responses are requested and decoded as gzip, brotli, or deflate.
 pub fn create_async_client(config: &CrawlerConfig) -> Result<reqwest::Client> {
     let mut headers = header::HeaderMap::new();
     headers.insert(
@@ -30,6 +89,7 @@ pub fn create_async_client(config: &CrawlerConfig) -> Result<reqwest::Client> {
         .timeout(Duration::from_secs(config.timeout_secs))
         .connect_timeout(Duration::from_secs(config.timeout_secs.min(10)))
         .pool_idle_timeout(Duration::from_secs(60))
+        .pool_max_idle_per_host(POOL_MAX_IDLE_PER_HOST)
         .tcp_keepalive(Duration::from_secs(30))
         .redirect(reqwest::redirect::Policy::limited(5))
         .build()?;
@@ -39,11 +99,52 @@ pub fn create_async_client(config: &CrawlerConfig) -> Result<reqwest::Client> {
 
 /// Fetch a page asynchronously and parse it as HTML.
 pub async fn fetch_page_async(client: &reqwest::Client, url: &str) -> Result<Html> {
-    let resp = client.get(url).send().await?;
+    let text = fetch_text_async(client, url).await?;
+    Ok(Html::parse_document(&text))
+}
+
+/// Fetch a page asynchronously and return its raw HTML source.
+///
+/// At most `MAX_CONCURRENT_PER_HOST` requests are in flight per host at any time,
+/// and transient failures are retried up to `MAX_RETRIES` times with exponential backoff.
+pub async fn fetch_text_async(client: &reqwest::Client, url: &str) -> Result<String> {
+    let mut attempt = 0;
+    loop {
+        match fetch_text_once(client, url).await {
+            Err(e) if attempt < MAX_RETRIES && e.is_retryable() => {
+                let delay = RETRY_BACKOFF_MS * 2u64.pow(attempt);
+                tokio::time::sleep(Duration::from_millis(delay)).await;
+                attempt += 1;
+            }
+            result => return result,
+        }
+    }
+}
+
+async fn fetch_text_once(client: &reqwest::Client, url: &str) -> Result<String> {
+    // Hold a host slot until the body is read (the semaphore is never closed)
+    let slots = host_slots(url);
+    let _permit = slots.acquire().await.ok();
+
+    let cache = RESPONSE_CACHE.get();
+    let mut request = client.get(url);
+    if let Some((etag, last_modified)) = cache.and_then(|c| c.validators(url)) {
+        if let Some(etag) = etag {
+            request = request.header(header::IF_NONE_MATCH, etag);
+        }
+        if let Some(last_modified) = last_modified {
+            request = request.header(header::IF_MODIFIED_SINCE, last_modified);
+        }
+    }
+
+    let resp = request.send().await?;
 
     // Process http response
     let status = resp.status();
     if status == StatusCode::NOT_MODIFIED {
+        if let Some(body) = cache.and_then(|c| c.body(url)) {
+            return Ok(body);
+        }
         return Err(AppError::UpstreamNotModified {
             url: url.to_string(),
         }
@@ -70,21 +171,59 @@ pub async fn fetch_page_async(client: &reqwest::Client, url: &str) -> Result<Htm
         }
     }
 
-    // Size limit (operational stability) - consider moving to config if needed
-    // reqwest reads the full body by default, so read as text first
-    // Check content-length to prevent large responses (error pages/file downloads).
+    // Check content-length to reject large responses (error pages/file downloads) up front.
     if let Some(len) = resp.content_length() {
-        let max = 2_000_000u64; // 2MB For example
-        if len > max {
+        if len > MAX_BODY_BYTES {
             return Err(AppError::UpstreamBodyTooLarge {
                 url: url.to_string(),
                 bytes: len,
-                max_bytes: max,
+                max_bytes: MAX_BODY_BYTES,
             }
             .into());
         }
     }
 
-    let text = resp.text().await?;
-    Ok(Html::parse_document(&text))
+    let Some(cache) = cache else {
+        return read_body_limited(url, resp).await;
+    };
+
+    let header_value = |name: header::HeaderName| {
+        resp.headers()
+            .get(name)
+            .and_then(|v| v.to_str().ok())
+            .map(str::to_string)
+    };
+    let etag = header_value(header::ETAG);
+    let last_modified = header_value(header::LAST_MODIFIED);
+
+    let text = read_body_limited(url, resp).await?;
+    if etag.is_some() || last_modified.is_some() {
+        cache.insert(
+            url,
+            CachedResponse {
+                etag,
+                last_modified,
+                body: text.clone(),
+            },
+        );
+    }
+    Ok(text)
+}
+
+/// Read a response body as text, aborting once it exceeds `MAX_BODY_BYTES`.
+///
+/// Chunked responses carry no content-length, so the limit is enforced while streaming.
+async fn read_body_limited(url: &str, mut resp: reqwest::Response) -> Result<String> {
+    let mut body = Vec::new();
+    while let Some(chunk) = resp.chunk().await? {
+        body.extend_from_slice(&chunk);
+        if body.len() as u64 > MAX_BODY_BYTES {
+            return Err(AppError::UpstreamBodyTooLarge {
+                url: url.to_string(),
+                bytes: body.len() as u64,
+                max_bytes: MAX_BODY_BYTES,
+            });
+        }
+    }
+    Ok(String::from_utf8_lossy(&body).into_owned())
 }
@@ -2,6 +2,7 @@
 
 //! Utility functions and helpers.
 
+pub mod cache;
 pub mod fs;
 pub mod http;
 pub mod log;
@@ -64,10 +64,42 @@ fn resolve_relative_path(base: &str, href: &str) -> String {
 /// );
 /// ```
 pub fn get_domain(url: &str) -> Option<String> {
+    domain_of(url).map(str::to_lowercase)
+}
+
+/// Check whether a URL belongs to `domain` (ASCII case-insensitive) without allocating.
+///
+/// # Examples
+/// ```
+/// use crawler::utils::url::has_domain;
+///
+/// assert!(has_domain("https://Example.com/path", "example.com"));
+/// assert!(!has_domain("https://other.com/path", "example.com"));
+/// ```
+pub fn has_domain(url: &str, domain: &str) -> bool {
+    domain_of(url).is_some_and(|d| d.eq_ignore_ascii_case(domain))
+}
+
+fn domain_of(url: &str) -> Option<&str> {
     let scheme_end = url.find("://")?;
     let after_scheme = &url[scheme_end + 3..];
-    let domain = after_scheme.split('/').next()?;
-    Some(domain.to_lowercase())
+    after_scheme.split('/').next()
+}
+
+/// Check whether two URLs address the same page, ignoring fragments and a trailing slash.
+///
+/// # Examples
+/// ```
+/// use crawler::utils::url::is_same_page;
+///
+/// assert!(is_same_page("https://example.com/", "https://example.com#top"));
+/// assert!(!is_same_page("https://example.com/", "https://example.com/sitemap"));
+/// ```
+pub fn is_same_page(a: &str, b: &str) -> bool {
+    fn page(url: &str) -> &str {
+        url.split('#').next().unwrap_or(url).trim_end_matches('/')
+    }
+    page(a) == page(b)
 }
 
 /// Extract a stable notice identifier from a URL.
@@ -176,6 +208,32 @@ mod tests {
         assert_eq!(get_domain("invalid-url"), None);
     }
 
+    #[test]
+    fn test_has_domain() {
+        assert!(has_domain(
+            "https://CS.yonsei.ac.kr/notice",
+            "cs.yonsei.ac.kr"
+        ));
+        assert!(!has_domain("https://www.yonsei.ac.kr/", "cs.yonsei.ac.kr"));
+        assert!(!has_domain("invalid-url", "cs.yonsei.ac.kr"));
+    }
+
+    #[test]
+    fn test_is_same_page() {
+        assert!(is_same_page(
+            "https://cs.yonsei.ac.kr/index.php",
+            "https://cs.yonsei.ac.kr/index.php#sitemap"
+        ));
+        assert!(is_same_page(
+            "https://cs.yonsei.ac.kr",
+            "https://cs.yonsei.ac.kr/"
+        ));
+        assert!(!is_same_page(
+            "https://cs.yonsei.ac.kr/",
+            "https://cs.yonsei.ac.kr/sitemap.php"
+        ));
+    }
+
     #[test]
     fn test_extract_notice_id_query_key() {
         let url = "https://example.com/view?articleNo=1234&mode=view";